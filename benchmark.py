@@ -8,9 +8,45 @@ import statistics
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
+def _run_one(solver_path: Path, word: str) -> tuple[str, float, int, str, str]:
+    """Solve a single word, timing the subprocess from inside the worker."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [str(solver_path), "solve", word],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    elapsed = time.perf_counter() - start
+    # Capture raw bytes and decode once rather than via a text-mode wrapper.
+    return (
+        word,
+        elapsed,
+        result.returncode,
+        result.stdout.decode("ascii", "replace"),
+        result.stderr.decode("ascii", "replace"),
+    )
+
+
+def _run_batch(solver_path: Path, words: list[str]) -> tuple[int, list[str], str]:
+    """Solve every word in one ``solve --batch`` process (one output line per word)."""
+    proc = subprocess.Popen(
+        [str(solver_path), "solve", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = proc.communicate(("\n".join(words) + "\n").encode("ascii"))
+    return (
+        proc.returncode,
+        stdout.decode("ascii", "replace").splitlines(),
+        stderr.decode("ascii", "replace"),
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -19,6 +55,19 @@ def main() -> None:
         default=10,
         help="Number of target words to benchmark (default: 10).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of solver processes to run concurrently (default: 1; higher "
+        "values finish sooner but per-word timings are measured under contention).",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Pipe all words through one long-lived solver process, or --jobs "
+        "concurrent shards (reports total wall time and throughput only).",
+    )
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parent
@@ -40,27 +89,55 @@ def main() -> None:
 
     words = words[: args.limit]
 
-    timings: list[float] = []
-
-    for word in words:
+    if args.batch:
+        jobs = max(1, min(args.jobs, len(words)))
+        shards = [words[i::jobs] for i in range(jobs)]
         start = time.perf_counter()
-        result = subprocess.run(
-            [str(solver_path), "solve", word],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        # Threads suffice here: each shard's work happens in its own solver process.
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(lambda shard: _run_batch(solver_path, shard), shards))
+        total = time.perf_counter() - start
+
+        for shard, (returncode, lines, stderr) in zip(shards, results):
+            if returncode != 0 or len(lines) != len(shard):
+                reason = stderr.strip() or "\n".join(lines).strip()
+                print(f"Batch solve failed: {reason}", file=sys.stderr)
+                sys.exit(returncode or 1)
+            for word, line in zip(shard, lines):
+                if "Solved" not in line:
+                    print(f"Failed solving '{word}': {line.strip()}", file=sys.stderr)
+                    sys.exit(1)
+
+        # Shards run concurrently, so wall time per word is throughput rather
+        # than the latency of an individual solve.
+        per_word = total / len(words) if words else 0.0
+        print(f"Batch wall time for {len(words)} words across {jobs} shard(s): {total:.4f} s")
+        print(f"Throughput over {len(words)} words: {per_word:.6f} s of wall time per word")
+        return
+
+    timings: list[float] = []
+    if args.jobs > 1:
+        print(
+            f"Warning: running {args.jobs} solves concurrently; per-word timings are "
+            "contended and not comparable with --jobs 1 results.",
+            file=sys.stderr,
         )
-        elapsed = time.perf_counter() - start
 
-        if result.returncode != 0 or "Solved" not in result.stdout:
-            stderr = result.stderr.strip()
-            if not stderr:
-                stderr = result.stdout.strip()
-            print(f"Failed solving '{word}': {stderr}", file=sys.stderr)
-            sys.exit(result.returncode or 1)
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [executor.submit(_run_one, solver_path, word) for word in words]
+        for future in as_completed(futures):
+            word, elapsed, returncode, stdout, stderr = future.result()
+
+            if returncode != 0 or "Solved" not in stdout:
+                stderr = stderr.strip()
+                if not stderr:
+                    stderr = stdout.strip()
+                print(f"Failed solving '{word}': {stderr}", file=sys.stderr)
+                executor.shutdown(cancel_futures=True)
+                sys.exit(returncode or 1)
 
-        timings.append(elapsed)
-        print(f"{word:>5}: {elapsed:.4f} s")
+            timings.append(elapsed)
+            print(f"{word:>5}: {elapsed:.4f} s")
 
     avg = statistics.fmean(timings) if timings else 0.0
     print(f"\nAverage solve time over {len(words)} words: {avg:.4f} s")
@@ -104,14 +104,22 @@ bool build_feedback_table_file(const std::string &path,
     std::cerr << "Failed to open '" << path << "' for writing.\n";
     return false;
   }
+  // Unpack every word's letters once, then compute and write a full row per
+  // guess instead of re-extracting letters and emitting one byte at a time.
+  std::vector<letter_codes> codes;
+  codes.reserve(words.size());
+  for (const auto word : words) {
+    codes.push_back(unpack_letter_codes(word));
+  }
+  std::vector<uint8_t> row(words.size());
   size_t written = 0;
-  for (const auto &guess : words) {
-    for (const auto &answer : words) {
-      const uint8_t feedback =
-          static_cast<uint8_t>(calculate_feedback_encoded(guess, answer));
-      file.put(static_cast<char>(feedback));
-      ++written;
+  for (const auto &guess : codes) {
+    for (size_t i = 0; i < codes.size(); ++i) {
+      row[i] = static_cast<uint8_t>(calculate_feedback_codes(guess, codes[i]));
     }
+    file.write(reinterpret_cast<const char *>(row.data()),
+               static_cast<std::streamsize>(row.size()));
+    written += row.size();
   }
   file.flush();
   if (!file) {
@@ -10,6 +10,7 @@
 #include <limits>
 #include <memory>
 #include <numeric>
+#include <unordered_map>
 #include <unordered_set>
 #include <vector>
 
@@ -173,46 +174,55 @@ bool build_subtree(TreeNode &node, const std::vector<size_t> &indices,
   }
 }
 
-uint32_t serialize_node(const TreeNode &node, std::vector<uint8_t> &buffer) {
-  const uint32_t offset = static_cast<uint32_t>(buffer.size());
-  const uint32_t count = static_cast<uint32_t>(node.edges.size());
-  buffer.insert(buffer.end(), reinterpret_cast<const uint8_t *>(&count),
-                reinterpret_cast<const uint8_t *>(&count) + sizeof(count));
-
-  std::vector<size_t> child_positions;
-  child_positions.reserve(node.edges.size());
-
-  for (const auto &edge : node.edges) {
-    buffer.insert(buffer.end(), reinterpret_cast<const uint8_t *>(&edge.feedback),
-                  reinterpret_cast<const uint8_t *>(&edge.feedback) +
-                      sizeof(edge.feedback));
-    const uint16_t reserved = 0;
-    buffer.insert(buffer.end(), reinterpret_cast<const uint8_t *>(&reserved),
-                  reinterpret_cast<const uint8_t *>(&reserved) +
-                      sizeof(reserved));
-    buffer.insert(buffer.end(),
-                  reinterpret_cast<const uint8_t *>(&edge.next_guess),
-                  reinterpret_cast<const uint8_t *>(&edge.next_guess) +
-                      sizeof(edge.next_guess));
-    child_positions.push_back(buffer.size());
-    const uint32_t placeholder = 0;
-    buffer.insert(buffer.end(),
-                  reinterpret_cast<const uint8_t *>(&placeholder),
-                  reinterpret_cast<const uint8_t *>(&placeholder) +
-                      sizeof(placeholder));
+template <typename T>
+size_t write_bytes(std::vector<uint8_t> &buffer, size_t pos, const T &value) {
+  std::memcpy(buffer.data() + pos, &value, sizeof(value));
+  return pos + sizeof(value);
+}
+
+// Serializes the tree in pre-order (node, then each child subtree in edge
+// order). A first pass assigns every node its final offset so the second
+// pass can emit each entry with its child offset already known, avoiding
+// recursion and placeholder patching. The buffer is grown exactly once to the
+// final size computed by the first pass.
+uint32_t serialize_tree(const TreeNode &root, std::vector<uint8_t> &buffer) {
+  const uint32_t base = static_cast<uint32_t>(buffer.size());
+
+  std::vector<const TreeNode *> order;
+  std::unordered_map<const TreeNode *, uint32_t> offsets;
+  std::vector<const TreeNode *> stack{&root};
+  uint32_t cursor = base;
+  while (!stack.empty()) {
+    const TreeNode *node = stack.back();
+    stack.pop_back();
+    order.push_back(node);
+    offsets.emplace(node, cursor);
+    cursor += static_cast<uint32_t>(sizeof(uint32_t) +
+                                    node->edges.size() * sizeof(LookupEntry));
+    for (auto it = node->edges.rbegin(); it != node->edges.rend(); ++it) {
+      if (it->child) {
+        stack.push_back(it->child.get());
+      }
+    }
   }
 
-  for (size_t i = 0; i < node.edges.size(); ++i) {
-    if (node.edges[i].child) {
-      const uint32_t child_offset =
-          sizeof(LookupHeader) +
-          serialize_node(*node.edges[i].child, buffer);
-      std::memcpy(buffer.data() + child_positions[i], &child_offset,
-                  sizeof(child_offset));
+  buffer.resize(cursor);
+  size_t pos = base;
+  for (const TreeNode *node : order) {
+    pos = write_bytes(buffer, pos, static_cast<uint32_t>(node->edges.size()));
+    for (const auto &edge : node->edges) {
+      LookupEntry entry{};
+      entry.feedback = edge.feedback;
+      entry.guess = edge.next_guess;
+      entry.child_offset = edge.child
+                               ? static_cast<uint32_t>(sizeof(LookupHeader)) +
+                                     offsets.at(edge.child.get())
+                               : 0;
+      pos = write_bytes(buffer, pos, entry);
     }
   }
 
-  return offset;
+  return base;
 }
 
 } // namespace
@@ -241,8 +251,7 @@ bool generate_lookup_table(const std::string &path,
   }
 
   std::vector<uint8_t> buffer;
-  buffer.reserve(1 << 20);
-  const uint32_t root_offset = serialize_node(root, buffer);
+  const uint32_t root_offset = serialize_tree(root, buffer);
 
   std::ofstream out(path, std::ios::binary | std::ios::trunc);
   if (!out) {
@@ -10,15 +10,25 @@
 #include "feedback_cache.h"
 #include "words_data.h"
 
+letter_codes unpack_letter_codes(encoded_word word) {
+  // Fixed shifts for positions 0-4 (5 bits per letter, first letter highest).
+  return {static_cast<uint8_t>((word >> 20) & 0x1F),
+          static_cast<uint8_t>((word >> 15) & 0x1F),
+          static_cast<uint8_t>((word >> 10) & 0x1F),
+          static_cast<uint8_t>((word >> 5) & 0x1F),
+          static_cast<uint8_t>(word & 0x1F)};
+}
+
 feedback_int calculate_feedback_encoded(encoded_word guess_encoded,
                                         encoded_word answer_encoded) {
-  uint8_t guess_codes[5];
-  uint8_t answer_codes[5];
-  uint8_t answer_counts[27] = {0};
+  return calculate_feedback_codes(unpack_letter_codes(guess_encoded),
+                                  unpack_letter_codes(answer_encoded));
+}
 
+feedback_int calculate_feedback_codes(const letter_codes &guess_codes,
+                                      const letter_codes &answer_codes) {
+  uint8_t answer_counts[27] = {0};
   for (int i = 0; i < 5; ++i) {
-    guess_codes[i] = get_char_code_at(guess_encoded, i);
-    answer_codes[i] = get_char_code_at(answer_encoded, i);
     answer_counts[answer_codes[i]]++;
   }
 
@@ -1,6 +1,8 @@
 #pragma once
 
+#include <array>
 #include <cstddef>
+#include <cstdint>
 #include <unordered_map>
 #include <unordered_set>
 #include <utility>
@@ -17,8 +19,15 @@ struct LookupTables {
 const LookupTables &load_lookup_tables();
 LookupTables build_lookup_tables_from_words(const std::vector<encoded_word> &words);
 
+// Letter codes (1-26) for the five positions of an encoded word.
+using letter_codes = std::array<uint8_t, 5>;
+
+letter_codes unpack_letter_codes(encoded_word word);
+
 feedback_int calculate_feedback_encoded(encoded_word guess_encoded,
                                         encoded_word answer_encoded);
+feedback_int calculate_feedback_codes(const letter_codes &guess_codes,
+                                      const letter_codes &answer_codes);
 
 std::vector<size_t> filter_candidate_indices(
     const std::vector<size_t> &indices, encoded_word guess,
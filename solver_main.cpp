@@ -14,10 +14,77 @@
 #include "solver_runtime.h"
 #include "words_data.h"
 
+void print_trace_json(const SolutionTrace &trace) {
+  std::cout << "[";
+  for (size_t i = 0; i < trace.steps.size(); ++i) {
+    const auto &step = trace.steps[i];
+    std::cout << "{\"guess\":\"" << decode_word(step.guess)
+              << "\",\"feedback\":" << step.feedback << "}";
+    if (i + 1 < trace.steps.size())
+      std::cout << ",";
+  }
+  std::cout << "]\n";
+}
+
+// Solves each word read from stdin against a single loaded lookup table so
+// callers can amortize process startup across many targets. Blank input lines
+// are skipped; every other input line produces exactly one output line: the
+// JSON trace with --dump-json, otherwise "<word>: Solved in N guesses:
+// <guesses>" (or an error description). Returns non-zero if any line named an
+// invalid word or failed to solve.
+int run_batch(bool dump_json, const std::vector<encoded_word> &words,
+              const FeedbackTable *feedback_table, const LookupTables &lookups,
+              const PrecomputedLookup *tree) {
+  bool any_failed = false;
+  std::string line;
+  while (std::getline(std::cin, line)) {
+    while (!line.empty() &&
+           std::isspace(static_cast<unsigned char>(line.back()))) {
+      line.pop_back();
+    }
+    if (line.empty())
+      continue;
+
+    const encoded_word encoded_answer = encode_word(line);
+    if (line.size() != 5 || !lookups.word_index.count(encoded_answer)) {
+      std::cerr << "Error: '" << line << "' is not in the valid word list.\n";
+      any_failed = true;
+      if (dump_json) {
+        std::cout << "[]\n";
+      } else {
+        std::cout << line << ": Error: not in the valid word list\n";
+      }
+      continue;
+    }
+
+    SolutionTrace trace;
+    run_non_interactive(encoded_answer, words, false, false, &trace, false,
+                        feedback_table, lookups, tree);
+
+    const bool solved =
+        !trace.steps.empty() && trace.steps.back().feedback == 242;
+    any_failed = any_failed || !solved;
+    if (dump_json) {
+      print_trace_json(trace);
+      continue;
+    }
+    std::cout << line << ": "
+              << (solved ? "Solved in " : "Failed after ")
+              << trace.steps.size() << " guesses:";
+    for (const auto &step : trace.steps) {
+      std::cout << ' ' << decode_word(step.guess);
+    }
+    std::cout << "\n";
+  }
+  std::cout.flush();
+  return any_failed ? 1 : 0;
+}
+
 void print_usage(const char *prog_name) {
   std::cout
       << "Usage:\n"
       << "  " << prog_name << " solve <word> [--debug]\n"
+      << "  " << prog_name << " solve --batch [--dump-json] < words.txt\n"
       << "  " << prog_name << " start [--debug]\n"
       << "  " << prog_name
       << " generate [--lookup-depth N] [--lookup-output FILE]\n"
@@ -29,6 +96,8 @@ void print_usage(const char *prog_name) {
          "diagnostics.\n"
       << "  --dump-json       Emit a JSON trace for solve mode instead of "
          "text.\n"
+      << "  --batch           Solve every word read from stdin (one per line), "
+         "printing one result line per word.\n"
       << "  --lookup-depth N  Depth for lookup generation (default: 6).\n"
       << "  --lookup-output FILE  Output path for lookup table (default: "
          "lookup_<word>.bin).\n"
@@ -46,6 +115,7 @@ int main(int argc, char *argv[]) {
 
   bool debug_flag = false;
   bool dump_json = false;
+  bool batch_mode = false;
   bool disable_lookup = false;
   bool rebuild_feedback_table = false;
   std::string word_list_override;
@@ -74,6 +144,10 @@ int main(int argc, char *argv[]) {
       dump_json = true;
       continue;
     }
+    if (arg == "--batch") {
+      batch_mode = true;
+      continue;
+    }
     if (arg == "--lookup-depth") {
       if (i + 1 >= argc) {
         std::cerr << "--lookup-depth requires a value.\n";
@@ -156,6 +230,10 @@ int main(int argc, char *argv[]) {
     std::cerr << "--dump-json is only valid in solve mode.\n";
     return 1;
   }
+  if (batch_mode && !solve_mode) {
+    std::cerr << "--batch is only valid in solve mode.\n";
+    return 1;
+  }
   if (disable_lookup) {
     std::cerr << "--disable-lookup is not supported when using the "
                  "precomputed solver.\n";
@@ -163,7 +241,17 @@ int main(int argc, char *argv[]) {
   }
 
   std::string word_to_solve;
-  if (solve_mode) {
+  if (solve_mode && batch_mode) {
+    if (!positional.empty()) {
+      std::cerr << "solve --batch reads target words from stdin; unexpected "
+                   "positional arguments.\n";
+      return 1;
+    }
+    if (debug_flag) {
+      std::cerr << "--debug is not supported with --batch.\n";
+      return 1;
+    }
+  } else if (solve_mode) {
     if (!positional.empty()) {
       word_to_solve = positional.front();
       positional.erase(positional.begin());
@@ -281,6 +369,10 @@ int main(int argc, char *argv[]) {
     return 0;
   }
 
+  if (batch_mode) {
+    return run_batch(dump_json, *words, feedback_ptr, *lookups, lookup_ptr);
+  }
+
   const encoded_word encoded_answer = encode_word(word_to_solve);
   if (!lookups->word_index.count(encoded_answer)) {
     std::cerr << "Error: '" << word_to_solve
@@ -293,15 +385,7 @@ int main(int argc, char *argv[]) {
                       debug_flag, feedback_ptr, *lookups, lookup_ptr);
 
   if (dump_json) {
-    std::cout << "[";
-    for (size_t i = 0; i < trace.steps.size(); ++i) {
-      const auto &step = trace.steps[i];
-      std::cout << "{\"guess\":\"" << decode_word(step.guess)
-                << "\",\"feedback\":" << step.feedback << "}";
-      if (i + 1 < trace.steps.size())
-        std::cout << ",";
-    }
-    std::cout << "]\n";
+    print_trace_json(trace);
   } else if (!debug_flag) {
     for (const auto &step : trace.steps) {
       std::cout << decode_word(step.guess) << ' ';
@@ -42,19 +42,14 @@ const uint8_t *PrecomputedLookup::find_child(const uint8_t *node,
     return nullptr;
   uint32_t count = *reinterpret_cast<const uint32_t *>(node);
   const uint8_t *ptr = node + 4;
-  for (uint32_t i = 0; i < count; ++i) {
-    uint16_t fb = *reinterpret_cast<const uint16_t *>(ptr);
-    ptr += 2;
-    ptr += 2;
-    encoded_word guess = *reinterpret_cast<const encoded_word *>(ptr);
-    ptr += sizeof(encoded_word);
-    uint32_t child = *reinterpret_cast<const uint32_t *>(ptr);
-    ptr += 4;
-    if (fb == feedback) {
-      guess_out = guess;
-      if (child == 0)
+  for (uint32_t i = 0; i < count; ++i, ptr += sizeof(LookupEntry)) {
+    LookupEntry entry;
+    std::memcpy(&entry, ptr, sizeof(entry));
+    if (entry.feedback == feedback) {
+      guess_out = entry.guess;
+      if (entry.child_offset == 0)
         return nullptr;
-      return buffer_.data() + child;
+      return buffer_.data() + entry.child_offset;
     }
   }
   return nullptr;
@@ -81,6 +76,10 @@ void run_non_interactive(encoded_word answer,
     std::cerr << "[timer] " << tag << " " << ms << " ms\n";
   };
 
+  // Keep stdout clean for callers that parse it (JSON dumps, --batch); failure
+  // diagnostics are routed to stderr whenever output printing is disabled.
+  std::ostream &failure_out = print_output ? std::cout : std::cerr;
+
   int turn = 1;
   encoded_word guess = kInitialGuess;
   const uint8_t *node = tree->root();
@@ -124,14 +123,14 @@ void run_non_interactive(encoded_word answer,
     }
 
     if (turn == 6) {
-      std::cout << "Solver failed to find the word. Last guess was '"
+      failure_out << "Solver failed to find the word. Last guess was '"
                 << decode_word(guess) << "'.\n";
       log_duration("failed-depth");
       return;
     }
 
     if (!node) {
-      std::cout << "Solver failed: lookup table missing entries.\n";
+      failure_out << "Solver failed: lookup table missing entries.\n";
       log_duration("failed-missing-node");
       return;
     }
@@ -140,7 +139,7 @@ void run_non_interactive(encoded_word answer,
     const uint8_t *next_node =
         tree->find_child(node, static_cast<uint16_t>(feedback_val), next_guess);
     if (next_guess == 0) {
-      std::cout << "Solver failed: lookup tree has no entry for feedback '"
+      failure_out << "Solver failed: lookup tree has no entry for feedback '"
                 << feedback_str << "' on turn " << turn << ".\n";
       log_duration("failed-branch");
       return;
@@ -28,6 +28,16 @@ struct LookupHeader {
 };
 static_assert(sizeof(LookupHeader) == 32, "LookupHeader must be 32 bytes");
 
+#pragma pack(push, 1)
+struct LookupEntry {
+  uint16_t feedback;
+  uint16_t reserved;
+  encoded_word guess;
+  uint32_t child_offset;
+};
+#pragma pack(pop)
+static_assert(sizeof(LookupEntry) == 16, "LookupEntry must be 16 bytes");
+
 class PrecomputedLookup {
 public:
   bool load(const std::string &path, encoded_word expected_start);
@@ -4,35 +4,64 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import mmap
 import struct
-from pathlib import Path
+import sys
+from collections.abc import Iterator
 
+COUNT_STRUCT = struct.Struct("<I")
 ENTRY_STRUCT = struct.Struct("<H H Q I")
-HEADER_STRUCT = struct.Struct("<4sIIQ5s3sI")
+HEADER_STRUCT = struct.Struct("<4sIIIQ5s3s")
+# Character for every 5-bit letter code (0 marks an empty slot).
+LETTERS = "-" + "".join(chr(code + 96) for code in range(1, 32))
 
 
+@functools.lru_cache(maxsize=None)
 def decode_word(value: int) -> str:
-    letters = []
-    for _ in range(5):
-        code = value & 0x1F
-        letters.append(chr(code + 96) if code else "-")
-        value >>= 5
-    return "".join(reversed(letters))
-
-
-def walk(buffer: bytes, offset: int, depth: int, prefix: list[int]) -> None:
-    count = struct.unpack_from("<I", buffer, offset)[0]
-    print("  " * depth + f"node@{offset}: entries={count}")
-    cursor = offset + 4
-    for _ in range(count):
-        feedback, _, guess, child = ENTRY_STRUCT.unpack_from(buffer, cursor)
-        cursor += ENTRY_STRUCT.size
-        print(
+    return (
+        LETTERS[(value >> 20) & 0x1F]
+        + LETTERS[(value >> 15) & 0x1F]
+        + LETTERS[(value >> 10) & 0x1F]
+        + LETTERS[(value >> 5) & 0x1F]
+        + LETTERS[value & 0x1F]
+    )
+
+
+def open_node(
+    view: memoryview, offset: int, depth: int
+) -> tuple[str, int, Iterator[tuple[int, int, int, int]]]:
+    (count,) = COUNT_STRUCT.unpack_from(view, offset)
+    start = offset + COUNT_STRUCT.size
+    return (
+        "  " * depth + f"node@{offset}: entries={count}",
+        depth,
+        ENTRY_STRUCT.iter_unpack(view[start : start + count * ENTRY_STRUCT.size]),
+    )
+
+
+def walk(view: memoryview, offset: int) -> Iterator[str]:
+    # Explicit stack of (depth, entry iterator) keeps the pre-order output of
+    # the old recursive walk without hitting Python's recursion limit. Lines
+    # are yielded as they are produced so output streams.
+    line, depth, entries = open_node(view, offset, 0)
+    yield line
+    stack = [(depth, entries)]
+    while stack:
+        depth, entries = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        feedback, _, guess, child = entry
+        yield (
             "  " * (depth + 1)
             + f"fb={feedback:03} guess={decode_word(guess)} child={child}"
         )
         if child:
-            walk(buffer, child, depth + 2, prefix + [feedback])
+            line, child_depth, child_entries = open_node(view, child, depth + 2)
+            yield line
+            stack.append((child_depth, child_entries))
 
 
 def main() -> None:
@@ -40,14 +69,18 @@ def main() -> None:
     parser.add_argument("path", help="lookup binary file", default="lookup_roate.bin")
     args = parser.parse_args()
 
-    data = Path(args.path).read_bytes()
-    magic, version, depth, start_enc, start_str, _, root_off = HEADER_STRUCT.unpack(
-        data[: HEADER_STRUCT.size]
-    )
-    print(
-        f"magic={magic.decode()} version={version} depth={depth} start={start_str.decode()} root={root_off}"
-    )
-    walk(data, root_off, 0, [])
+    # Map the file instead of reading it so large trees page in on demand.
+    with open(args.path, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        with memoryview(mm) as view:
+            magic, version, depth, root_off, start_enc, start_str, _ = (
+                HEADER_STRUCT.unpack_from(view, 0)
+            )
+            print(
+                f"magic={magic.decode()} version={version} depth={depth} start={start_str.decode()} root={root_off}"
+            )
+            sys.stdout.writelines(line + "\n" for line in walk(view, root_off))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import subprocess
 import tempfile
 from pathlib import Path
@@ -16,35 +17,93 @@ def read_words(words_path: Path):
     return lower
 
 def build_subset(words, size, pinned):
-    subset = []
-    seen = set()
-    for p in pinned:
-        if p in words and p not in seen:
-            subset.append(p)
-            seen.add(p)
+    # Pinned words are always kept (even past `size`), followed by at least one
+    # other word; stop scanning as soon as the subset is full.
+    subset = list(dict.fromkeys(p for p in pinned if p in words))
+    seen = set(subset)
+    remaining = max(1, size - len(subset))
     for w in words:
         if w in seen:
             continue
         subset.append(w)
         seen.add(w)
-        if len(subset) >= size:
+        remaining -= 1
+        if remaining == 0:
             break
     return subset
 
-def run_generate(binary, subset_file, start_word, depth, timeout):
+async def run_generate(binary, subset_file, start_word, depth, timeout, sem):
     output_file = subset_file.with_suffix('.bin')
     cmd = [binary, 'generate', '--word-list', str(subset_file),
            '--lookup-start', start_word, '--lookup-depth', str(depth),
            '--lookup-output', str(output_file)]
-    start = time.perf_counter()
-    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-    duration = time.perf_counter() - start
+    async with sem:
+        start = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        finally:
+            # Reap the child on timeout, cancellation, or any other error.
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+        duration = time.perf_counter() - start
     summary = None
-    for line in (proc.stdout + '\n' + proc.stderr).splitlines():
+    output = stdout + b'\n' + stderr
+    for line in output.decode('ascii', 'replace').splitlines():
         if line.startswith('Wrote lookup table'):
             summary = line.strip()
     return duration, summary
 
+async def profile_sizes(args, words):
+    # Reported times are wall-clock per run, and overlapping runs compete for
+    # CPU and memory bandwidth, so --jobs defaults to 1 to keep timings
+    # comparable across profiles; raise it to trade accuracy for turnaround.
+    sem = asyncio.Semaphore(max(1, args.jobs))
+    tmp_paths = []
+    warnings = []
+    try:
+        for size in args.sizes:
+            subset = build_subset(words, size, PINNED_WORDS)
+            warnings.append(f"Requested size {size} but only {len(subset)} words available"
+                            if len(subset) < size else None)
+            with tempfile.NamedTemporaryFile('w', delete=False, buffering=1 << 16) as tmp:
+                tmp.write('\n'.join(subset) + '\n')
+                tmp_paths.append(Path(tmp.name))
+        tasks = [asyncio.create_task(run_generate(
+                     args.solver, tmp_path, args.start, args.depth, args.timeout, sem))
+                 for tmp_path in tmp_paths]
+        results = {}
+        next_index = 0
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[tasks.index(task)] = task.result()
+                # Print in --sizes order, as soon as every earlier size is done.
+                while next_index in results:
+                    duration, summary = results.pop(next_index)
+                    if warnings[next_index]:
+                        print(warnings[next_index])
+                    print(f"subset={args.sizes[next_index]} time={duration:.2f}s "
+                          f"summary={summary}", flush=True)
+                    next_index += 1
+        finally:
+            # On failure, stop the remaining runs (their children get reaped).
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        for tmp_path in tmp_paths:
+            tmp_path.unlink(missing_ok=True)
+
 def main():
     parser = argparse.ArgumentParser(description='Profile lookup generator over subsets')
     parser.add_argument('--solver', default='./build/solver', help='Path to solver binary')
@@ -54,22 +113,12 @@ def main():
     parser.add_argument('--depth', type=int, default=6)
     parser.add_argument('--timeout', type=int, default=300, help='Timeout per run in seconds')
     parser.add_argument('--words-file', default='words.txt', help='Base word list')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Generator runs to overlap (default: 1; higher values skew timings)')
     args = parser.parse_args()
 
     words = read_words(Path(args.words_file))
-    for size in args.sizes:
-        subset = build_subset(words, size, PINNED_WORDS)
-        if len(subset) < size:
-            print(f"Requested size {size} but only {len(subset)} words available")
-        with tempfile.NamedTemporaryFile('w', delete=False) as tmp:
-            for w in subset:
-                tmp.write(w + '\n')
-            tmp_path = Path(tmp.name)
-        try:
-            duration, summary = run_generate(args.solver, tmp_path, args.start, args.depth, args.timeout)
-            print(f"subset={size} time={duration:.2f}s summary={summary}")
-        finally:
-            tmp_path.unlink(missing_ok=True)
-    
+    asyncio.run(profile_sizes(args, words))
+
 if __name__ == '__main__':
     main()